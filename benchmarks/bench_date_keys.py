@@ -0,0 +1,72 @@
+# ============================================
+# BENCHMARK — dérivation des date_id (Gold)
+# ============================================
+# Compare l'ancienne dérivation (strftime("%Y%m%d") -> Int64, puis
+# re-parsing texte pour dim_date) au calcul arithmétique de src/model.py.
+#
+#   python -m benchmarks.bench_date_keys --rows 100000 1000000
+# ============================================
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.model import date_key, dim_date_from_keys
+
+
+def strftime_key(s: pd.Series) -> pd.Series:
+    return pd.to_datetime(s, errors="coerce").dt.strftime("%Y%m%d").astype("Int64")
+
+
+def strftime_dim_date(date_ids: pd.Series) -> pd.DataFrame:
+    df = pd.DataFrame({"date_id": date_ids.dropna().astype("Int64").unique()})
+    df["date"] = pd.to_datetime(df["date_id"].astype(str), format="%Y%m%d", errors="coerce")
+    df = df.dropna(subset=["date"]).drop_duplicates("date_id").sort_values("date_id").reset_index(drop=True)
+    df["year"] = df["date"].dt.year.astype("Int64")
+    df["month"] = df["date"].dt.month.astype("Int64")
+    df["day"] = df["date"].dt.day.astype("Int64")
+    return df
+
+
+def make_timestamps(n: int, null_rate: float = 0.02, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    s = pd.Series(pd.Timestamp("2016-09-01") + pd.to_timedelta(rng.integers(0, 760 * 86400, n), unit="s"))
+    s[rng.random(n) < null_rate] = pd.NaT
+    return s
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for n in args.rows:
+        ts = make_timestamps(n)
+        pd.testing.assert_series_equal(strftime_key(ts), date_key(ts), check_names=False)
+
+        keys = date_key(ts)
+        old, new = strftime_dim_date(keys), dim_date_from_keys(keys)
+        assert old["date_id"].tolist() == new["date_id"].tolist()
+
+        t_old = best_of(lambda: strftime_key(ts))
+        t_new = best_of(lambda: date_key(ts))
+        d_old = best_of(lambda: strftime_dim_date(keys))
+        d_new = best_of(lambda: dim_date_from_keys(keys))
+        print(
+            f"rows={n:>10,}  date_id: strftime={t_old:.4f}s arithmetic={t_new:.4f}s (x{t_old / t_new:.0f})"
+            f"  | dim_date: parse={d_old:.4f}s calendar={d_new:.4f}s (x{d_old / d_new:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
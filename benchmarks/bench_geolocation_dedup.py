@@ -0,0 +1,94 @@
+# ============================================
+# BENCHMARK — déduplication geolocation (Silver)
+# ============================================
+# Compare l'ancienne déduplication (drop_duplicates sur 3 colonnes)
+# à la clé int64 empaquetée de src/transform.py, sur des données
+# synthétiques au format Silver (ZIP entier, ville/état category)
+# et Bronze (chaînes). Plusieurs graphies ville / état par ZIP :
+# plusieurs triplets par préfixe, comme dans Olist.
+#
+#   python -m benchmarks.bench_geolocation_dedup --rows 1000000 10000000 50000000
+# ============================================
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.transform import GEOLOCATION_KEY, geolocation_dedup
+
+
+def drop_duplicates_dedup(df: pd.DataFrame) -> pd.DataFrame:
+    """Ancienne implémentation."""
+    return df.drop_duplicates(subset=GEOLOCATION_KEY).reset_index(drop=True)
+
+
+# graphies de ville par ZIP (ex. "sao paulo", "são paulo", "Sao Paulo") et
+# part des lignes portant le second état du ZIP (ZIP frontalier / erreur)
+CITY_VARIANTS_P = [0.75, 0.15, 0.07, 0.03]
+STATE_NOISE = 0.02
+
+
+def make_geolocation(n: int, silver: bool = True, seed: int = 0) -> pd.DataFrame:
+    # ~19 000 préfixes ZIP, ~8 000 villes x graphies, 27 états (ordres de grandeur Olist)
+    rng = np.random.default_rng(seed)
+    zips = rng.integers(1000, 20000, n)
+    n_variants = len(CITY_VARIANTS_P)
+    variant = rng.choice(n_variants, size=n, p=CITY_VARIANTS_P)
+    cities = pd.Categorical.from_codes(
+        (zips % 8000) * n_variants + variant,
+        [f"city_{i}_v{v}" for i in range(8000) for v in range(n_variants)],
+    )
+    del variant
+    state_codes = zips % 27
+    noisy = rng.random(n) < STATE_NOISE
+    state_codes[noisy] = (state_codes[noisy] + 1) % 27
+    states = pd.Categorical.from_codes(state_codes, [f"S{i:02d}" for i in range(27)])
+    del state_codes, noisy
+    df = pd.DataFrame({
+        "geolocation_zip_code_prefix": zips,
+        "geolocation_lat": rng.uniform(-30, -5, n),
+        "geolocation_lng": rng.uniform(-60, -35, n),
+        "geolocation_city": cities,
+        "geolocation_state": states,
+    })
+    if not silver:
+        df["geolocation_zip_code_prefix"] = df["geolocation_zip_code_prefix"].astype(str).str.zfill(5)
+        df["geolocation_city"] = df["geolocation_city"].astype(str)
+        df["geolocation_state"] = df["geolocation_state"].astype(str)
+    return df
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000, 50_000_000])
+    parser.add_argument("--bronze", action="store_true", help="colonnes texte (format Bronze)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.rows:
+        df = make_geolocation(n, silver=not args.bronze)
+        old, new = drop_duplicates_dedup(df), geolocation_dedup(df)
+        pd.testing.assert_frame_equal(old, new)
+        triplets = len(new)
+        del old, new
+
+        t_old = best_of(lambda: drop_duplicates_dedup(df), args.repeat)
+        t_new = best_of(lambda: geolocation_dedup(df), args.repeat)
+        print(
+            f"rows={n:>11,}  triplets={triplets:>7,}  "
+            f"drop_duplicates={t_old:.4f}s packed_key={t_new:.4f}s (x{t_old / t_new:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
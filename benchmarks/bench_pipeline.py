@@ -0,0 +1,235 @@
+# ============================================
+# BENCHMARK — pipeline complet par étape (données synthétiques)
+# ============================================
+# Génère (ou réutilise) les CSV Bronze synthétiques de src/synthetic.py
+# pour chaque facteur d'échelle, puis mesure chaque étape :
+#   extract   extract.load_all (cache Bronze désactivé par défaut)
+#   silver    transform.build_silver
+#   gold      model.build_gold
+#   load      pipeline.load_gold : DDL, chargement en masse, index, marts
+#             (base SQLite temporaire, comme pipeline.run)
+# Temps mur / CPU (meilleur de --repeat), pic RSS par étape (VmHWM remis
+# à zéro avant chaque étape sous Linux) et pic tracemalloc (passe
+# séparée, le traçage ralentit le code mesuré).
+# Les étapes sont mesurées l'une après l'autre (load_all, build_silver :
+# mêmes EXTRACT_MAX_WORKERS / SILVER_MAX_WORKERS que le DAG de
+# pipeline.run, sans le recouvrement entre tables) ; pour le DAG lui-même,
+# pipeline.run(instrument=True) (src/metrics.py).
+# Résultats en JSON (commit git, versions, machine) ; --compare pour
+# comparer à un fichier produit sur un autre commit.
+#
+#   python -m benchmarks.bench_pipeline --scale 1 10 --repeat 3
+#   python -m benchmarks.bench_pipeline --scale 1 --compare data/benchmarks/pipeline_<commit>.json
+# ============================================
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Optional
+import numpy as np
+import pandas as pd
+import pandera
+
+from src import extract, load, metrics, model, pipeline, synthetic, transform
+from src.config import BASE_DIR, DATA_DIR, EXTRACT_MAX_WORKERS, SILVER_MAX_WORKERS, SYNTHETIC_SEED
+
+STAGES = ("extract", "silver", "gold", "load")
+RESULTS_DIR = DATA_DIR / "benchmarks"
+
+
+# ---------- MÉMOIRE ----------
+# mêmes mesures que les spans de src/metrics.py (VmHWM, clear_refs, ru_maxrss)
+
+def _mb(n_bytes: Optional[int]) -> Optional[float]:
+    return round(n_bytes / 2**20, 1) if n_bytes is not None else None
+
+
+def rows_of(value) -> Optional[int]:
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(v) for v in value.values() if isinstance(v, pd.DataFrame))
+    return None
+
+
+# ---------- MESURE ----------
+
+def measure(fn: Callable[[], object], trace: bool = False):
+    """Exécute fn ; retourne (résultat, mesures)."""
+    gc.collect()
+    resettable = metrics.reset_hwm()
+    rss_before = metrics.rss_bytes()
+    if trace:
+        tracemalloc.start()
+    t0, c0 = time.perf_counter(), time.process_time()
+    value = fn()
+    stats = {
+        "wall_s": time.perf_counter() - t0,
+        "cpu_s": time.process_time() - c0,
+        "rss_start_mb": _mb(rss_before),
+        # sans remise à zéro (hors Linux) : pic depuis le démarrage du process
+        "rss_peak_mb": _mb(metrics.hwm_bytes() or metrics.peak_rss_bytes()),
+        "rss_peak_reset": resettable,
+        "rows_out": rows_of(value),
+    }
+    if trace:
+        stats["tracemalloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+        tracemalloc.stop()
+    return value, stats
+
+
+def run_once(db_path: Path, use_cache: bool, trace: bool = False) -> Dict[str, dict]:
+    """Une exécution complète ; mesures par étape (sorties gardées en mémoire, comme le pipeline)."""
+    db_path.unlink(missing_ok=True)
+    out: Dict[str, dict] = {}
+    bronze, out["extract"] = measure(
+        lambda: extract.load_all(max_workers=EXTRACT_MAX_WORKERS, use_cache=use_cache), trace)
+    out["extract"]["tables"] = {name: len(df) for name, df in bronze.items()}
+    silver, out["silver"] = measure(lambda: transform.build_silver(bronze), trace)
+    gold, out["gold"] = measure(lambda: model.build_gold(silver), trace)
+    loaded, out["load"] = measure(lambda: pipeline.load_gold(gold), trace)
+    out["load"]["rows_out"] = sum(s["rows"] for s in loaded["load_stats"].values())
+    del bronze, silver, gold
+    return out
+
+
+def bench_scale(scale: float, repeat: int, data_dir: Path, use_cache: bool, trace: bool) -> dict:
+    """
+    Temps : meilleur de repeat ; RSS : maximum observé ; tracemalloc : passe dédiée.
+    Base SQLite et cache Bronze dans un dossier temporaire : le cache réel
+    (mêmes noms de tables) n'est jamais écrasé par les données synthétiques.
+    """
+    work = Path(tempfile.mkdtemp(prefix="bench_pipeline_"))
+    extract.BRONZE_DIR, extract.BRONZE_CACHE_DIR = data_dir, work / "cache"
+    load.DB_PATH = work / "olist.db"
+    try:
+        runs = [run_once(load.DB_PATH, use_cache) for _ in range(repeat)]
+        traced = run_once(load.DB_PATH, use_cache, trace=True) if trace else None
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    stages = {}
+    for stage in STAGES:
+        walls = [r[stage]["wall_s"] for r in runs]
+        best = runs[int(np.argmin(walls))][stage]
+        stages[stage] = {
+            "wall_s": round(best["wall_s"], 4),
+            "wall_s_all": [round(w, 4) for w in walls],
+            "cpu_s": round(best["cpu_s"], 4),
+            "rss_start_mb": best["rss_start_mb"],
+            "rss_peak_mb": max(r[stage]["rss_peak_mb"] for r in runs),
+            "rss_peak_reset": best["rss_peak_reset"],
+            "tracemalloc_peak_mb": traced[stage]["tracemalloc_peak_mb"] if traced else None,
+            "rows_out": best["rows_out"],
+        }
+    return {
+        "scale": scale,
+        "data_dir": str(data_dir),
+        "bronze_rows": runs[0]["extract"]["tables"],
+        "total_wall_s": round(sum(s["wall_s"] for s in stages.values()), 4),
+        "stages": stages,
+    }
+
+
+# ---------- DONNÉES ET MÉTADONNÉES ----------
+
+def ensure_data(scale: float, seed: int, regenerate: bool = False) -> Path:
+    """CSV synthétiques de l'échelle donnée (générés si absents)."""
+    data_dir = synthetic.default_dir(scale, seed)
+    if regenerate or not all((data_dir / f).exists() for f in extract.REGISTRY.values()):
+        t0 = time.perf_counter()
+        synthetic.write_bronze(data_dir, scale, seed)
+        print(f"scale={scale:g}  données générées en {time.perf_counter() - t0:.1f}s -> {data_dir}")
+    return data_dir
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], cwd=BASE_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict:
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "created_at": pd.Timestamp.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "pandera": pandera.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(new: dict, old: dict) -> None:
+    """Ratio nouveau / ancien par échelle et par étape (temps mur, pic RSS)."""
+    old_runs = {r["scale"]: r for r in old["runs"]}
+    print(f"comparaison {(old.get('commit') or '?')[:10]} -> {(new.get('commit') or '?')[:10]}")
+    for run in new["runs"]:
+        ref = old_runs.get(run["scale"])
+        if ref is None:
+            print(f"scale={run['scale']:g}  absent du fichier de référence")
+            continue
+        for stage in STAGES:
+            a, b = ref["stages"][stage], run["stages"][stage]
+            print(
+                f"scale={run['scale']:>5g}  {stage:<8} wall {a['wall_s']:.3f}s -> {b['wall_s']:.3f}s "
+                f"(x{b['wall_s'] / max(a['wall_s'], 1e-9):.2f})  "
+                f"rss {a['rss_peak_mb']:.0f} -> {b['rss_peak_mb']:.0f} Mo"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, nargs="+", default=[1.0], help="1 = volumétrie Olist")
+    parser.add_argument("--seed", type=int, default=SYNTHETIC_SEED)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--regenerate", action="store_true", help="régénère les CSV synthétiques")
+    parser.add_argument("--bronze-cache", action="store_true", help="utilise le cache Bronze (Parquet)")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="pas de passe tracemalloc")
+    parser.add_argument("--out", type=Path, default=None, help=f"défaut : {RESULTS_DIR}/pipeline_<commit>.json")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON de référence (autre commit)")
+    args = parser.parse_args()
+
+    result = {
+        "benchmark": "pipeline",
+        **environment(),
+        "config": {
+            "seed": args.seed, "repeat": args.repeat, "bronze_cache": args.bronze_cache,
+            "extract_max_workers": EXTRACT_MAX_WORKERS, "silver_max_workers": SILVER_MAX_WORKERS,
+        },
+        "runs": [],
+    }
+    for scale in args.scale:
+        data_dir = ensure_data(scale, args.seed, args.regenerate)
+        run = bench_scale(scale, args.repeat, data_dir, args.bronze_cache, not args.no_tracemalloc)
+        result["runs"].append(run)
+        print(
+            f"scale={scale:>5g}  " + "  ".join(
+                f"{stage}={s['wall_s']:.3f}s/{s['rss_peak_mb']:.0f}Mo" for stage, s in run["stages"].items()
+            ) + f"  total={run['total_wall_s']:.3f}s"
+        )
+
+    out = args.out or RESULTS_DIR / f"pipeline_{(result['commit'] or 'nogit')[:10]}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"résultats -> {out}")
+
+    if args.compare:
+        compare(result, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ============================================
+# BENCHMARK — avis canoniques (Silver)
+# ============================================
+# Compare l'ancienne canonicalisation (tri stable par review_id +
+# date, puis drop_duplicates(keep="last")) au max par groupe sans
+# tri de src/transform.py (review_id factorisé), trié par review_id
+# ou non (sort=False, temps linéaire).
+#
+#   python -m benchmarks.bench_reviews_canonical --rows 100000 1000000 10000000
+# ============================================
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.transform import reviews_canonical
+
+
+def sorted_canonical(df: pd.DataFrame) -> pd.DataFrame:
+    """Ancienne implémentation."""
+    df = df.sort_values(by=["review_id", "review_creation_date"], ascending=[True, True], kind="stable")
+    return df.drop_duplicates(subset=["review_id"], keep="last").reset_index(drop=True)
+
+
+def make_reviews(n: int, dup_rate: float = 0.1, seed: int = 0) -> pd.DataFrame:
+    # ~10 % de review_id en plusieurs versions, dates au jour (égalités fréquentes)
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(0, int(n * (1 - dup_rate)), n)
+    dates = pd.Series(pd.Timestamp("2016-10-01") + pd.to_timedelta(rng.integers(0, 700, n), unit="D"))
+    dates[rng.random(n) < 0.01] = pd.NaT
+    return pd.DataFrame({
+        "review_id": pd.Series(ids).map("{:032x}".format).astype("str"),
+        "order_id": pd.Series(rng.integers(0, n, n)).map("{:032x}".format).astype("str"),
+        "review_score": rng.integers(1, 6, n),
+        "review_creation_date": dates,
+    })
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.rows:
+        df = make_reviews(n)
+        pd.testing.assert_frame_equal(sorted_canonical(df), reviews_canonical(df))
+
+        t_old = best_of(lambda: sorted_canonical(df), args.repeat)
+        t_new = best_of(lambda: reviews_canonical(df), args.repeat)
+        t_lin = best_of(lambda: reviews_canonical(df, sort=False), args.repeat)
+        print(
+            f"rows={n:>11,}  sort+drop_duplicates={t_old:.4f}s group_max={t_new:.4f}s (x{t_old / t_new:.1f})"
+            f"  | sort=False={t_lin:.4f}s (x{t_old / t_lin:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ============================================
+# BENCHMARK — check temporel order_reviews (Bronze)
+# ============================================
+# Compare l'ancien check dataframe-level (apply ligne à ligne)
+# au check vectorisé de src/schemas/checks.py.
+#
+#   python -m benchmarks.bench_temporal_check --rows 100000
+# ============================================
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.schemas.checks import ordered_when_present, temporal_violations
+
+
+def apply_based_check(df: pd.DataFrame) -> bool:
+    """Ancienne implémentation (avant vectorisation)."""
+    return (
+        df[["review_creation_date", "review_answer_timestamp"]]
+        .apply(
+            lambda row: (
+                True
+                if (pd.isna(row["review_creation_date"]) or pd.isna(row["review_answer_timestamp"]))
+                else row["review_answer_timestamp"] >= row["review_creation_date"]
+            ),
+            axis=1,
+        )
+    ).all()
+
+
+def make_reviews(n: int, null_rate: float = 0.05, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    created = pd.Timestamp("2017-01-01") + pd.to_timedelta(rng.integers(0, 600 * 86400, n), unit="s")
+    answered = created + pd.to_timedelta(rng.integers(0, 5 * 86400, n), unit="s")
+    df = pd.DataFrame({"review_creation_date": created, "review_answer_timestamp": answered})
+    df.loc[rng.random(n) < null_rate, "review_answer_timestamp"] = pd.NaT
+    return df
+
+
+def timeit(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    check = ordered_when_present("review_creation_date", "review_answer_timestamp")
+
+    for n in args.rows:
+        df = make_reviews(n)
+        assert apply_based_check(df) == bool(check(df).check_passed)
+        assert len(temporal_violations(df, "review_creation_date", "review_answer_timestamp")) == 0
+
+        t_apply = timeit(lambda: apply_based_check(df), repeat=1)
+        t_vec = timeit(lambda: check(df))
+        print(f"rows={n:>10,}  apply={t_apply:8.4f}s  vectorized={t_vec:8.4f}s  speedup=x{t_apply / t_vec:,.0f}")
+
+
+if __name__ == "__main__":
+    main()